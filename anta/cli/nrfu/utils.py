@@ -60,28 +60,34 @@ def print_table(ctx: click.Context, group_by: Literal["device", "test"] | None =
 def print_json(ctx: click.Context, output: pathlib.Path | None = None) -> None:
     """Print result in a json format."""
     results = _get_result_manager(ctx)
+    # Serialize the results only once for both the console and the output file
+    json_results = results.json
     console.print()
     console.print(Panel("JSON results", style="cyan"))
-    rich.print_json(results.json)
+    if console.is_terminal:
+        rich.print_json(json_results)
+    else:
+        # Skip highlighting when the output is not a terminal, keeping the same formatting as rich.print_json()
+        console.out(json.dumps(json.loads(json_results), indent=2, ensure_ascii=False), highlight=False)
     if output is not None:
         with output.open(mode="w", encoding="utf-8") as fout:
-            fout.write(results.json)
+            fout.write(json_results)
 
 
 def print_text(ctx: click.Context) -> None:
     """Print results as simple text."""
     console.print()
     for test in _get_result_manager(ctx).results:
-        message = f" ({test.messages[0]!s})" if len(test.messages) > 0 else ""
-        console.print(f"{test.name} :: {test.test} :: [{test.result}]{test.result.upper()}[/{test.result}]{message}", highlight=False)
+        result = test.result
+        message = f" ({test.messages[0]!s})" if test.messages else ""
+        console.print(f"{test.name} :: {test.test} :: [{result}]{result.upper()}[/{result}]{message}", highlight=False)
 
 
 def print_jinja(results: ResultManager, template: pathlib.Path, output: pathlib.Path | None = None) -> None:
     """Print result based on template."""
     console.print()
     reporter = ReportJinja(template_path=template)
-    json_data = json.loads(results.json)
-    report = reporter.render(json_data)
+    report = reporter.render(results.dump)
     console.print(report)
     if output is not None:
         with output.open(mode="w", encoding="utf-8") as file:
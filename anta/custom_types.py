@@ -112,6 +112,11 @@ def validate_regex(value: str) -> str:
     return value
 
 
+def strip_lines(value: str) -> str:
+    """Remove leading and trailing whitespaces from each line of a multi-line string."""
+    return "\n".join(line.strip() for line in value.split("\n"))
+
+
 # ANTA framework
 TestStatus = Literal["unset", "success", "failure", "error", "skipped"]
 
@@ -167,3 +172,4 @@ Revision = Annotated[int, Field(ge=1, le=99)]
 Hostname = Annotated[str, Field(pattern=REGEXP_TYPE_HOSTNAME)]
 Port = Annotated[int, Field(ge=1, le=65535)]
 RegexString = Annotated[str, AfterValidator(validate_regex)]
+Banner = Annotated[str, AfterValidator(strip_lines)]
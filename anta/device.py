@@ -9,6 +9,7 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Literal
 
 import asyncssh
@@ -16,7 +17,7 @@ import httpcore
 from aiocache import Cache
 from aiocache.plugins import HitMissRatioPlugin
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError, TimeoutException
+from httpx import ConnectError, HTTPError, Limits, TimeoutException
 
 import asynceapi
 from anta import __DEBUG__
@@ -155,15 +156,16 @@ class AntaDevice(ABC):
         # Need to ignore pylint no-member as Cache is a proxy class and pylint is not smart enough
         # https://github.com/pylint-dev/pylint/issues/7258
         if self.cache is not None and self.cache_locks is not None and command.use_cache:
-            async with self.cache_locks[command.uid]:
-                cached_output = await self.cache.get(command.uid)  # pylint: disable=no-member
+            uid = command.uid
+            async with self.cache_locks[uid]:
+                cached_output = await self.cache.get(uid)  # pylint: disable=no-member
 
                 if cached_output is not None:
                     logger.debug("Cache hit for %s on %s", command.command, self.name)
                     command.output = cached_output
                 else:
                     await self._collect(command=command, collection_id=collection_id)
-                    await self.cache.set(command.uid, command.output)  # pylint: disable=no-member
+                    await self.cache.set(uid, command.output)  # pylint: disable=no-member
         else:
             await self._collect(command=command, collection_id=collection_id)
 
@@ -175,7 +177,19 @@ class AntaDevice(ABC):
             commands: The commands to collect.
             collection_id: An identifier used to build the eAPI request ID.
         """
-        await asyncio.gather(*(self.collect(command=command, collection_id=collection_id) for command in commands))
+        results = await asyncio.gather(
+            *(self.collect(command=command, collection_id=collection_id) for command in commands),
+            return_exceptions=True,
+        )
+        for command, result in zip(commands, results):
+            if isinstance(result, Exception):
+                # _collect() is user-defined code expected to catch its own exceptions.
+                # Record unexpected ones on the command so the other commands are still collected.
+                message = f"Exception raised while collecting command '{command.command}' on device {self.name}"
+                anta_log_exception(result, message, logger)
+                command.errors = [exc_to_str(result)]
+            elif isinstance(result, BaseException):
+                raise result
 
     @abstractmethod
     async def refresh(self) -> None:
@@ -204,7 +218,8 @@ class AntaDevice(ABC):
         raise NotImplementedError(msg)
 
 
-class AsyncEOSDevice(AntaDevice):
+# The eAPI session, its concurrency limit and the prebuilt 'enable' command are all per-device state
+class AsyncEOSDevice(AntaDevice):  # pylint: disable=too-many-instance-attributes
     """Implementation of AntaDevice for EOS using aio-eapi.
 
     Attributes
@@ -234,6 +249,7 @@ class AsyncEOSDevice(AntaDevice):
         enable: bool = False,
         insecure: bool = False,
         disable_cache: bool = False,
+        max_concurrency: int = 100,
     ) -> None:
         """Instantiate an AsyncEOSDevice.
 
@@ -252,6 +268,8 @@ class AsyncEOSDevice(AntaDevice):
             insecure: Disable SSH Host Key validation.
             proto: eAPI protocol. Value can be 'http' or 'https'.
             disable_cache: Disable caching for all commands for this device.
+            max_concurrency: Maximum number of concurrent eAPI requests sent to this device.
+                             Also used as the size of the HTTP connection pool of this device.
 
         """
         if host is None:
@@ -269,9 +287,20 @@ class AsyncEOSDevice(AntaDevice):
             message = f"'password' is required to instantiate device '{self.name}'"
             logger.error(message)
             raise ValueError(message)
+        if max_concurrency < 1:
+            message = f"'max_concurrency' must be at least 1 to instantiate device '{self.name}', got {max_concurrency}"
+            logger.error(message)
+            raise ValueError(message)
         self.enable = enable
         self._enable_password = enable_password
-        self._session: asynceapi.Device = asynceapi.Device(host=host, port=port, username=username, password=password, proto=proto, timeout=timeout)
+        # The 'enable' command is prepended to every eAPI request in privileged mode, build it once
+        self._enable_command: dict[str, str] = {"cmd": "enable"} if enable_password is None else {"cmd": "enable", "input": str(enable_password)}
+        # Size the HTTP connection pool to the maximum number of concurrent eAPI requests, keeping the httpx default of 20 keep-alive connections
+        limits = Limits(max_connections=max_concurrency, max_keepalive_connections=20)
+        self._session: asynceapi.Device = asynceapi.Device(host=host, port=port, username=username, password=password, proto=proto, timeout=timeout, limits=limits)
+        self._max_concurrency = max_concurrency
+        # The semaphore is created lazily in _collect() as __init__ may run without an event loop
+        self._semaphore: asyncio.Semaphore | None = None
         ssh_params: dict[str, Any] = {}
         if insecure:
             ssh_params["known_hosts"] = None
@@ -306,7 +335,7 @@ class AsyncEOSDevice(AntaDevice):
         """
         return (self._session.host, self._session.port)
 
-    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:  # noqa: C901  function is too complex - because of many required except blocks #pylint: disable=line-too-long
+    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
         """Collect device command output from EOS using aio-eapi.
 
         Supports outformat `json` and `text` as output structure.
@@ -318,25 +347,18 @@ class AsyncEOSDevice(AntaDevice):
             command: The command to collect.
             collection_id: An identifier used to build the eAPI request ID.
         """
-        commands: list[dict[str, str | int]] = []
-        if self.enable and self._enable_password is not None:
-            commands.append(
-                {
-                    "cmd": "enable",
-                    "input": str(self._enable_password),
-                },
-            )
-        elif self.enable:
-            # No password
-            commands.append({"cmd": "enable"})
-        commands += [{"cmd": command.command, "revision": command.revision}] if command.revision else [{"cmd": command.command}]
+        commands: list[dict[str, Any]] = [self._enable_command] if self.enable else []
+        commands.append({"cmd": command.command, "revision": command.revision} if command.revision else {"cmd": command.command})
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
         try:
-            response: list[dict[str, Any] | str] = await self._session.cli(
-                commands=commands,
-                ofmt=command.ofmt,
-                version=command.version,
-                req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
-            )  # type: ignore[assignment] # multiple commands returns a list
+            async with self._semaphore:
+                response: list[dict[str, Any] | str] = await self._session.cli(
+                    commands=commands,
+                    ofmt=command.ofmt,
+                    version=command.version,
+                    req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
+                )  # type: ignore[assignment] # multiple commands returns a list
             # Do not keep response of 'enable' command
             command.output = response[-1]
         except asynceapi.EapiCommandError as e:
@@ -387,10 +409,21 @@ class AsyncEOSDevice(AntaDevice):
         - hw_model: The hardware model of the device
         """
         logger.debug("Refreshing device %s", self.name)
-        self.is_online = await self._session.check_connection()
+        show_version = AntaCommand(command="show version")
+        # Send 'show version' while checking the eAPI port to overlap both round trips
+        show_version_task = asyncio.create_task(self._collect(show_version))
+        is_online = False
+        try:
+            is_online = await self._session.check_connection()
+        finally:
+            # Never leave the 'show version' request running if the port check failed or raised
+            if not is_online:
+                show_version_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await show_version_task
+        self.is_online = is_online
         if self.is_online:
-            show_version = AntaCommand(command="show version")
-            await self._collect(show_version)
+            await show_version_task
             if not show_version.collected:
                 logger.warning("Cannot get hardware information from device %s", self.name)
             else:
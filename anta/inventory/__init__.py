@@ -7,18 +7,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from ipaddress import ip_address, ip_network
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from pydantic import ValidationError
-from yaml import YAMLError, safe_load
+from yaml import YAMLError, load
+
+try:
+    # Use the libyaml C bindings when available, they are significantly faster for large inventories
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 from anta.device import AntaDevice, AsyncEOSDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.inventory.models import AntaInventoryInput
 from anta.logger import anta_log_exception
 
+if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv6Address
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,7 +116,7 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for network in inventory_input.networks:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=network.disable_cache)
-                for host_ip in ip_network(str(network.network)):
+                for host_ip in network.network:
                     device = AsyncEOSDevice(host=str(host_ip), tags=network.tags, **updated_kwargs)
                     inventory.add_device(device)
         except ValueError as e:
@@ -138,25 +146,25 @@ class AntaInventory(dict[str, AntaDevice]):
         if inventory_input.ranges is None:
             return
 
-        try:
-            for range_def in inventory_input.ranges:
-                updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
-                range_increment = ip_address(str(range_def.start))
-                range_stop = ip_address(str(range_def.end))
-                while range_increment <= range_stop:  # type: ignore[operator]
-                    # mypy raise an issue about comparing IPv4Address and IPv6Address
-                    # but this is handled by the ipaddress module natively by raising a TypeError
-                    device = AsyncEOSDevice(host=str(range_increment), tags=range_def.tags, **updated_kwargs)
+        for range_def in inventory_input.ranges:
+            # start and end are already ip_address objects validated by AntaInventoryRange
+            range_start = cast("IPv4Address | IPv6Address", range_def.start)
+            range_stop = cast("IPv4Address | IPv6Address", range_def.end)
+            if range_start.version != range_stop.version:
+                message = f"A range in the inventory has different address families (IPv4 vs IPv6): {range_start} - {range_stop}"
+                logger.error(message)
+                raise InventoryIncorrectSchemaError(message)
+            updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
+            # Iterate over the integer values of the range instead of incrementing and comparing address objects
+            address_class = type(range_start)
+            try:
+                for host_ip in range(int(range_start), int(range_stop) + 1):
+                    device = AsyncEOSDevice(host=str(address_class(host_ip)), tags=range_def.tags, **updated_kwargs)
                     inventory.add_device(device)
-                    range_increment += 1
-        except ValueError as e:
-            message = "Could not parse the range section in the inventory"
-            anta_log_exception(e, message, logger)
-            raise InventoryIncorrectSchemaError(message) from e
-        except TypeError as e:
-            message = "A range in the inventory has different address families (IPv4 vs IPv6)"
-            anta_log_exception(e, message, logger)
-            raise InventoryIncorrectSchemaError(message) from e
+            except ValueError as e:
+                message = "Could not parse the range section in the inventory"
+                anta_log_exception(e, message, logger)
+                raise InventoryIncorrectSchemaError(message) from e
 
     # pylint: disable=too-many-arguments
     @staticmethod
@@ -214,7 +222,7 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             filename = Path(filename)
             with filename.open(encoding="UTF-8") as file:
-                data = safe_load(file)
+                data = load(file, Loader=SafeLoader)
         except (TypeError, YAMLError, OSError) as e:
             message = f"Unable to parse ANTA Device Inventory file '{filename}'"
             anta_log_exception(e, message, logger)
@@ -273,9 +281,8 @@ class AntaInventory(dict[str, AntaDevice]):
                 return bool(not established_only or device.established)
             return False
 
-        filtered_devices: list[AntaDevice] = list(filter(_filter_devices, self.values()))
         result = AntaInventory()
-        for device in filtered_devices:
+        for device in filter(_filter_devices, self.values()):
             result.add_device(device)
         return result
 
@@ -220,6 +220,8 @@ class ReportJinja:
             raise FileNotFoundError(msg)
 
         self.template_path = template_path
+        # Compiled templates, keyed by the (trim_blocks, lstrip_blocks) rendering options
+        self._templates: dict[tuple[bool, bool], Template] = {}
 
     def render(self, data: list[dict[str, Any]], *, trim_blocks: bool = True, lstrip_blocks: bool = True) -> str:
         """Build a report based on a Jinja2 template.
@@ -250,7 +252,10 @@ class ReportJinja:
             Rendered template
 
         """
-        with self.template_path.open(encoding="utf-8") as file_:
-            template = Template(file_.read(), trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks)
+        key = (trim_blocks, lstrip_blocks)
+        if (template := self._templates.get(key)) is None:
+            with self.template_path.open(encoding="utf-8") as file_:
+                template = Template(file_.read(), trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks)
+            self._templates[key] = template
 
         return template.render({"data": data})
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic import TypeAdapter
 
@@ -15,6 +15,9 @@ from anta.custom_types import TestStatus
 if TYPE_CHECKING:
     from anta.result_manager.models import TestResult
 
+# Building a TypeAdapter is expensive, do it once instead of for every added result
+TEST_STATUS_VALIDATOR: TypeAdapter[TestStatus] = TypeAdapter(TestStatus)
+
 
 class ResultManager:
     """Helper to manage Test Results and generate reports.
@@ -111,10 +114,15 @@ class ResultManager:
         for e in value:
             self.add(e)
 
+    @property
+    def dump(self) -> list[dict[str, Any]]:
+        """Get a list of dictionary of the results."""
+        return [result.model_dump() for result in self._result_entries]
+
     @property
     def json(self) -> str:
         """Get a JSON representation of the results."""
-        return json.dumps([result.model_dump() for result in self._result_entries], indent=4)
+        return json.dumps(self.dump, indent=4)
 
     def add(self, result: TestResult) -> None:
         """Add a result to the ResultManager instance.
@@ -125,8 +133,7 @@ class ResultManager:
         """
 
         def _update_status(test_status: TestStatus) -> None:
-            result_validator: TypeAdapter[TestStatus] = TypeAdapter(TestStatus)
-            result_validator.validate_python(test_status)
+            TEST_STATUS_VALIDATOR.validate_python(test_status)
             if test_status == "error":
                 self.error_status = True
                 return
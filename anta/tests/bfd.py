@@ -21,6 +21,11 @@ if TYPE_CHECKING:
     from anta.models import AntaTemplate
 
 
+def _hours_since(timestamp: float, current_time: datetime) -> float:
+    """Return the number of hours elapsed between a UTC epoch `timestamp` and `current_time`."""
+    return (current_time - datetime.fromtimestamp(timestamp, tz=timezone.utc)).total_seconds() / 3600
+
+
 class VerifyBFDSpecificPeers(AntaTest):
     """Verifies if the IPv4 BFD peer's sessions are UP and remote disc is non-zero in the specified VRF.
 
@@ -65,16 +70,13 @@ class VerifyBFDSpecificPeers(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBFDSpecificPeers."""
         failures: dict[Any, Any] = {}
+        bfd_vrfs = self.instance_commands[0].json_output["vrfs"]
 
         # Iterating over BFD peers
         for bfd_peer in self.inputs.bfd_peers:
             peer = str(bfd_peer.peer_address)
             vrf = bfd_peer.vrf
-            bfd_output = get_value(
-                self.instance_commands[0].json_output,
-                f"vrfs..{vrf}..ipv4Neighbors..{peer}..peerStats..",
-                separator="..",
-            )
+            bfd_output = get_value(bfd_vrfs, f"{vrf}..ipv4Neighbors..{peer}..peerStats..", separator="..")
 
             # Check if BFD peer configured
             if not bfd_output:
@@ -152,6 +154,7 @@ class VerifyBFDPeersIntervals(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBFDPeersIntervals."""
         failures: dict[Any, Any] = {}
+        bfd_vrfs = self.instance_commands[0].json_output["vrfs"]
 
         # Iterating over BFD peers
         for bfd_peers in self.inputs.bfd_peers:
@@ -162,11 +165,7 @@ class VerifyBFDPeersIntervals(AntaTest):
             tx_interval = bfd_peers.tx_interval * 1000
             rx_interval = bfd_peers.rx_interval * 1000
             multiplier = bfd_peers.multiplier
-            bfd_output = get_value(
-                self.instance_commands[0].json_output,
-                f"vrfs..{vrf}..ipv4Neighbors..{peer}..peerStats..",
-                separator="..",
-            )
+            bfd_output = get_value(bfd_vrfs, f"{vrf}..ipv4Neighbors..{peer}..peerStats..", separator="..")
 
             # Check if BFD peer configured
             if not bfd_output:
@@ -242,8 +241,9 @@ class VerifyBFDPeersHealth(AntaTest):
 
         # Extract the current timestamp and command output
         clock_output = self.instance_commands[1].json_output
-        current_timestamp = clock_output["utcTime"]
+        current_time = datetime.fromtimestamp(clock_output["utcTime"], tz=timezone.utc)
         bfd_output = self.instance_commands[0].json_output
+        down_threshold = self.inputs.down_threshold
 
         # set the initial result
         self.result.is_success()
@@ -261,17 +261,13 @@ class VerifyBFDPeersHealth(AntaTest):
                     peer_status = peer_data["status"]
                     remote_disc = peer_data["remoteDisc"]
                     remote_disc_info = f" with remote disc {remote_disc}" if remote_disc == 0 else ""
-                    last_down = peer_data["lastDown"]
-                    hours_difference = (
-                        datetime.fromtimestamp(current_timestamp, tz=timezone.utc) - datetime.fromtimestamp(last_down, tz=timezone.utc)
-                    ).total_seconds() / 3600
 
                     # Check if peer status is not up
                     if peer_status != "up":
                         down_failures.append(f"{peer} is {peer_status} in {vrf} VRF{remote_disc_info}.")
 
-                    # Check if the last down is within the threshold
-                    elif self.inputs.down_threshold and hours_difference < self.inputs.down_threshold:
+                    # Check if the last down is within the threshold, the last down is only converted when a threshold is provided
+                    elif down_threshold and (hours_difference := _hours_since(peer_data["lastDown"], current_time)) < down_threshold:
                         up_failures.append(f"{peer} in {vrf} VRF was down {round(hours_difference)} hours ago{remote_disc_info}.")
 
                     # Check if remote disc is 0
@@ -90,10 +90,11 @@ class VerifyMlagInterfaces(AntaTest):
         if command_output["state"] == "disabled":
             self.result.is_skipped("MLAG is disabled")
             return
-        if command_output["mlagPorts"]["Inactive"] == 0 and command_output["mlagPorts"]["Active-partial"] == 0:
+        mlag_ports = command_output["mlagPorts"]
+        if mlag_ports["Inactive"] == 0 and mlag_ports["Active-partial"] == 0:
             self.result.is_success()
         else:
-            self.result.is_failure(f"MLAG status is not OK: {command_output['mlagPorts']}")
+            self.result.is_failure(f"MLAG status is not OK: {mlag_ports}")
 
 
 class VerifyMlagConfigSanity(AntaTest):
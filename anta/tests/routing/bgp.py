@@ -85,12 +85,14 @@ def _check_peer_issues(peer_data: dict[str, Any] | None) -> dict[str, Any]:
     if peer_data is None:
         return {"peerNotFound": True}
 
-    if any(key not in peer_data for key in ["peerState", "inMsgQueue", "outMsgQueue"]):
+    try:
+        peer_state, in_msg_queue, out_msg_queue = peer_data["peerState"], peer_data["inMsgQueue"], peer_data["outMsgQueue"]
+    except KeyError as e:
         msg = "Provided BGP peer data is invalid."
-        raise ValueError(msg)
+        raise ValueError(msg) from e
 
-    if peer_data["peerState"] != "Established" or peer_data["inMsgQueue"] != 0 or peer_data["outMsgQueue"] != 0:
-        return {"peerState": peer_data["peerState"], "inMsgQueue": peer_data["inMsgQueue"], "outMsgQueue": peer_data["outMsgQueue"]}
+    if peer_state != "Established" or in_msg_queue != 0 or out_msg_queue != 0:
+        return {"peerState": peer_state, "inMsgQueue": in_msg_queue, "outMsgQueue": out_msg_queue}
 
     return {}
 
@@ -238,14 +240,16 @@ class VerifyBGPPeerCount(AntaTest):
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
         """Render the template for each BGP address family in the input list."""
         commands = []
+        # Compare the template once instead of for every address family
+        summary_vrf_template = template == VerifyBGPPeerCount.commands[0]
         for afi in self.inputs.address_families:
-            if template == VerifyBGPPeerCount.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
+            if summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
                 commands.append(template.render(afi=afi.afi, safi=afi.safi, vrf=afi.vrf))
 
             # For SR-TE SAFI, the EOS command supports sr-te first then ipv4/ipv6
-            elif template == VerifyBGPPeerCount.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
+            elif summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
                 commands.append(template.render(afi=afi.safi, safi=afi.afi, vrf=afi.vrf))
-            elif template == VerifyBGPPeerCount.commands[1] and afi.afi not in ["ipv4", "ipv6"]:
+            elif not summary_vrf_template and afi.afi not in ["ipv4", "ipv6"]:
                 commands.append(template.render(afi=afi.afi))
         return commands
 
@@ -255,10 +259,10 @@ class VerifyBGPPeerCount(AntaTest):
         self.result.is_success()
 
         failures: dict[tuple[str, Any], dict[str, Any]] = {}
+        # Reversed so that the first matching input entry wins, as with a linear scan
+        expected_peers = {(entry.afi, entry.safi, entry.vrf): entry.num_peers for entry in reversed(self.inputs.address_families)}
 
         for command in self.instance_commands:
-            num_peers = None
-            peer_count = 0
             command_output = command.json_output
 
             afi = command.params.afi
@@ -269,20 +273,13 @@ class VerifyBGPPeerCount(AntaTest):
             if afi == "sr-te":
                 afi, safi = safi, afi
 
-            for input_entry in self.inputs.address_families:
-                if input_entry.afi == afi and input_entry.safi == safi and input_entry.vrf == afi_vrf:
-                    num_peers = input_entry.num_peers
-                    break
+            num_peers = expected_peers.get((afi, safi, afi_vrf))
 
             if not (vrfs := command_output.get("vrfs")):
                 _add_bgp_failures(failures=failures, afi=afi, safi=safi, vrf=afi_vrf, issue="Not Configured")
                 continue
 
-            if afi_vrf == "all":
-                for vrf_data in vrfs.values():
-                    peer_count += len(vrf_data["peers"])
-            else:
-                peer_count += len(command_output["vrfs"][afi_vrf]["peers"])
+            peer_count = sum(len(vrf_data["peers"]) for vrf_data in vrfs.values()) if afi_vrf == "all" else len(vrfs[afi_vrf]["peers"])
 
             if peer_count != num_peers:
                 _add_bgp_failures(failures=failures, afi=afi, safi=safi, vrf=afi_vrf, issue=f"Expected: {num_peers}, Actual: {peer_count}")
@@ -378,14 +375,16 @@ class VerifyBGPPeersHealth(AntaTest):
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
         """Render the template for each BGP address family in the input list."""
         commands = []
+        # Compare the template once instead of for every address family
+        summary_vrf_template = template == VerifyBGPPeersHealth.commands[0]
         for afi in self.inputs.address_families:
-            if template == VerifyBGPPeersHealth.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
+            if summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
                 commands.append(template.render(afi=afi.afi, safi=afi.safi, vrf=afi.vrf))
 
             # For SR-TE SAFI, the EOS command supports sr-te first then ipv4/ipv6
-            elif template == VerifyBGPPeersHealth.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
+            elif summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
                 commands.append(template.render(afi=afi.safi, safi=afi.afi, vrf=afi.vrf))
-            elif template == VerifyBGPPeersHealth.commands[1] and afi.afi not in ["ipv4", "ipv6"]:
+            elif not summary_vrf_template and afi.afi not in ["ipv4", "ipv6"]:
                 commands.append(template.render(afi=afi.afi))
         return commands
 
@@ -416,13 +415,7 @@ class VerifyBGPPeersHealth(AntaTest):
                     _add_bgp_failures(failures=failures, afi=afi, safi=safi, vrf=afi_vrf, issue="No Peers")
                     continue
 
-                peer_issues = {}
-                for peer, peer_data in peers.items():
-                    issues = _check_peer_issues(peer_data)
-
-                    if issues:
-                        peer_issues[peer] = issues
-
+                peer_issues = {peer: issues for peer, peer_data in peers.items() if (issues := _check_peer_issues(peer_data))}
                 if peer_issues:
                     _add_bgp_failures(failures=failures, afi=afi, safi=safi, vrf=vrf, issue=peer_issues)
 
@@ -528,15 +521,16 @@ class VerifyBGPSpecificPeers(AntaTest):
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
         """Render the template for each BGP address family in the input list."""
         commands = []
-
+        # Compare the template once instead of for every address family
+        summary_vrf_template = template == VerifyBGPSpecificPeers.commands[0]
         for afi in self.inputs.address_families:
-            if template == VerifyBGPSpecificPeers.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
+            if summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi != "sr-te":
                 commands.append(template.render(afi=afi.afi, safi=afi.safi, vrf=afi.vrf))
 
             # For SR-TE SAFI, the EOS command supports sr-te first then ipv4/ipv6
-            elif template == VerifyBGPSpecificPeers.commands[0] and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
+            elif summary_vrf_template and afi.afi in ["ipv4", "ipv6"] and afi.safi == "sr-te":
                 commands.append(template.render(afi=afi.safi, safi=afi.afi, vrf=afi.vrf))
-            elif template == VerifyBGPSpecificPeers.commands[1] and afi.afi not in ["ipv4", "ipv6"]:
+            elif not summary_vrf_template and afi.afi not in ["ipv4", "ipv6"]:
                 commands.append(template.render(afi=afi.afi))
         return commands
 
@@ -546,6 +540,8 @@ class VerifyBGPSpecificPeers(AntaTest):
         self.result.is_success()
 
         failures: dict[tuple[str, Any], dict[str, Any]] = {}
+        # Reversed so that the first matching input entry wins, as with a linear scan
+        expected_peers = {(entry.afi, entry.safi, entry.vrf): entry.peers for entry in reversed(self.inputs.address_families)}
 
         for command in self.instance_commands:
             command_output = command.json_output
@@ -558,10 +554,7 @@ class VerifyBGPSpecificPeers(AntaTest):
             if afi == "sr-te":
                 afi, safi = safi, afi
 
-            for input_entry in self.inputs.address_families:
-                if input_entry.afi == afi and input_entry.safi == safi and input_entry.vrf == afi_vrf:
-                    afi_peers = input_entry.peers
-                    break
+            afi_peers = expected_peers[(afi, safi, afi_vrf)]
 
             if not (vrfs := command_output.get("vrfs")):
                 _add_bgp_failures(failures=failures, afi=afi, safi=safi, vrf=afi_vrf, issue="Not Configured")
@@ -729,6 +722,7 @@ class VerifyBGPPeerMPCaps(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPPeerMPCaps."""
         failures: dict[str, Any] = {"bgp_peers": {}}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
@@ -738,10 +732,7 @@ class VerifyBGPPeerMPCaps(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -811,6 +802,7 @@ class VerifyBGPPeerASNCap(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPPeerASNCap."""
         failures: dict[str, Any] = {"bgp_peers": {}}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
@@ -819,10 +811,7 @@ class VerifyBGPPeerASNCap(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -889,6 +878,7 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPPeerRouteRefreshCap."""
         failures: dict[str, Any] = {"bgp_peers": {}}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
@@ -897,10 +887,7 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -969,6 +956,7 @@ class VerifyBGPPeerMD5Auth(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPPeerMD5Auth."""
         failures: dict[str, Any] = {"bgp_peers": {}}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each command
         for bgp_peer in self.inputs.bgp_peers:
@@ -977,10 +965,7 @@ class VerifyBGPPeerMD5Auth(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Check if BGP output exists
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -1049,7 +1034,7 @@ class VerifyEVPNType2Route(AntaTest):
         """Main test function for VerifyEVPNType2Route."""
         self.result.is_success()
         no_evpn_routes = []
-        bad_evpn_routes = []
+        bad_evpn_routes: list[str] = []
 
         for command in self.instance_commands:
             address = command.params.address
@@ -1060,15 +1045,12 @@ class VerifyEVPNType2Route(AntaTest):
                 no_evpn_routes.append((address, vni))
                 continue
             # Verify that each EVPN route has at least one valid and active path
-            for route, route_data in evpn_routes.items():
-                has_active_path = False
-                for path in route_data["evpnRoutePaths"]:
-                    if path["routeType"]["valid"] is True and path["routeType"]["active"] is True:
-                        # At least one path is valid and active, no need to check the other paths
-                        has_active_path = True
-                        break
-                if not has_active_path:
-                    bad_evpn_routes.append(route)
+            # any() stops at the first valid and active path, no need to check the other paths
+            bad_evpn_routes.extend(
+                route
+                for route, route_data in evpn_routes.items()
+                if not any(path["routeType"]["valid"] is True and path["routeType"]["active"] is True for path in route_data["evpnRoutePaths"])
+            )
 
         if no_evpn_routes:
             self.result.is_failure(f"The following VXLAN endpoint do not have any EVPN Type-2 route: {no_evpn_routes}")
@@ -1121,6 +1103,7 @@ class VerifyBGPAdvCommunities(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPAdvCommunities."""
         failures: dict[str, Any] = {"bgp_peers": {}}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
@@ -1129,10 +1112,7 @@ class VerifyBGPAdvCommunities(AntaTest):
             failure: dict[str, dict[str, dict[str, Any]]] = {"bgp_peers": {peer: {vrf: {}}}}
 
             # Verify BGP peer
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer)) is None:
                 failure["bgp_peers"][peer][vrf] = {"status": "Not configured"}
                 failures = deep_update(failures, failure)
                 continue
@@ -1202,6 +1182,7 @@ class VerifyBGPTimers(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPTimers."""
         failures: dict[str, Any] = {}
+        command_output = self.instance_commands[0].json_output
 
         # Iterate over each bgp peer
         for bgp_peer in self.inputs.bgp_peers:
@@ -1211,10 +1192,7 @@ class VerifyBGPTimers(AntaTest):
             keep_alive_time = bgp_peer.keep_alive_time
 
             # Verify BGP peer
-            if (
-                not (bgp_output := get_value(self.instance_commands[0].json_output, f"vrfs.{vrf}.peerList"))
-                or (bgp_output := get_item(bgp_output, "peerAddress", peer_address)) is None
-            ):
+            if not (bgp_output := get_value(command_output, f"vrfs.{vrf}.peerList")) or (bgp_output := get_item(bgp_output, "peerAddress", peer_address)) is None:
                 failures[peer_address] = {vrf: "Not configured"}
                 continue
 
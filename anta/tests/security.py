@@ -7,15 +7,21 @@ from __future__ import annotations
 
 # Mypy does not understand AntaTest.Input typing
 # mypy: disable-error-code=attr-defined
-from datetime import datetime, timezone
+import re
 from ipaddress import IPv4Address
-from typing import ClassVar
+from typing import ClassVar, get_args
 
 from pydantic import BaseModel, Field, model_validator
 
-from anta.custom_types import EcdsaKeySize, EncryptionAlgorithm, PositiveInteger, RsaKeySize
+from anta.custom_types import Banner, EcdsaKeySize, EncryptionAlgorithm, PositiveInteger, RsaKeySize
 from anta.models import AntaCommand, AntaTemplate, AntaTest
-from anta.tools import get_failed_logs, get_item, get_value
+from anta.tools import get_failed_logs, get_inactive_acls
+
+# Allowed key sizes per encryption algorithm, used to validate VerifyAPISSLCertificate inputs
+RSA_KEY_SIZES = frozenset(get_args(RsaKeySize))
+ECDSA_KEY_SIZES = frozenset(get_args(EcdsaKeySize))
+# Certificate details verified by VerifyAPISSLCertificate, as reported in its failure messages
+CERTIFICATE_DETAILS_KEYS = ("subject.commonName", "publicKey.encryptionAlgorithm", "publicKey.size")
 
 
 class VerifySSHStatus(AntaTest):
@@ -44,11 +50,11 @@ class VerifySSHStatus(AntaTest):
         """Main test function for VerifySSHStatus."""
         command_output = self.instance_commands[0].text_output
 
-        try:
-            line = next(line for line in command_output.split("\n") if line.startswith("SSHD status"))
-        except StopIteration:
+        # Search the status line directly instead of splitting the whole output into lines
+        if (status_match := re.search(r"^SSHD status.*$", command_output, re.MULTILINE)) is None:
             self.result.is_error("Could not find SSH status in returned output.")
             return
+        line = status_match.group()
         status = line.split("is ")[1]
 
         if status == "disabled":
@@ -98,7 +104,7 @@ class VerifySSHIPv4Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} SSH IPv4 ACL(s) in vrf {self.inputs.vrf} but got {ipv4_acl_number}")
             return
 
-        not_configured_acl = [acl["name"] for acl in ipv4_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        not_configured_acl = get_inactive_acls(ipv4_acl_list, self.inputs.vrf)
 
         if not_configured_acl:
             self.result.is_failure(f"SSH IPv4 ACL(s) not configured or active in vrf {self.inputs.vrf}: {not_configured_acl}")
@@ -147,7 +153,7 @@ class VerifySSHIPv6Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} SSH IPv6 ACL(s) in vrf {self.inputs.vrf} but got {ipv6_acl_number}")
             return
 
-        not_configured_acl = [acl["name"] for acl in ipv6_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        not_configured_acl = get_inactive_acls(ipv6_acl_list, self.inputs.vrf)
 
         if not_configured_acl:
             self.result.is_failure(f"SSH IPv6 ACL(s) not configured or active in vrf {self.inputs.vrf}: {not_configured_acl}")
@@ -300,7 +306,7 @@ class VerifyAPIIPv4Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} eAPI IPv4 ACL(s) in vrf {self.inputs.vrf} but got {ipv4_acl_number}")
             return
 
-        not_configured_acl = [acl["name"] for acl in ipv4_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        not_configured_acl = get_inactive_acls(ipv4_acl_list, self.inputs.vrf)
 
         if not_configured_acl:
             self.result.is_failure(f"eAPI IPv4 ACL(s) not configured or active in vrf {self.inputs.vrf}: {not_configured_acl}")
@@ -350,7 +356,7 @@ class VerifyAPIIPv6Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} eAPI IPv6 ACL(s) in vrf {self.inputs.vrf} but got {ipv6_acl_number}")
             return
 
-        not_configured_acl = [acl["name"] for acl in ipv6_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        not_configured_acl = get_inactive_acls(ipv6_acl_list, self.inputs.vrf)
 
         if not_configured_acl:
             self.result.is_failure(f"eAPI IPv6 ACL(s) not configured or active in vrf {self.inputs.vrf}: {not_configured_acl}")
@@ -423,11 +429,11 @@ class VerifyAPISSLCertificate(AntaTest):
 
                 If encryption_algorithm is ECDSA then key_size should be in {256, 384, 521}.
                 """
-                if self.encryption_algorithm == "RSA" and self.key_size not in RsaKeySize.__args__:
+                if self.encryption_algorithm == "RSA" and self.key_size not in RSA_KEY_SIZES:
                     msg = f"`{self.certificate_name}` key size {self.key_size} is invalid for RSA encryption. Allowed sizes are {RsaKeySize.__args__}."
                     raise ValueError(msg)
 
-                if self.encryption_algorithm == "ECDSA" and self.key_size not in EcdsaKeySize.__args__:
+                if self.encryption_algorithm == "ECDSA" and self.key_size not in ECDSA_KEY_SIZES:
                     msg = f"`{self.certificate_name}` key size {self.key_size} is invalid for ECDSA encryption. Allowed sizes are {EcdsaKeySize.__args__}."
                     raise ValueError(msg)
 
@@ -440,7 +446,7 @@ class VerifyAPISSLCertificate(AntaTest):
         self.result.is_success()
 
         # Extract certificate and clock output
-        certificate_output = self.instance_commands[0].json_output
+        certificates_output = self.instance_commands[0].json_output.get("certificates", {})
         clock_output = self.instance_commands[1].json_output
         current_timestamp = clock_output["utcTime"]
 
@@ -448,12 +454,13 @@ class VerifyAPISSLCertificate(AntaTest):
         for certificate in self.inputs.certificates:
             # Collecting certificate expiry time and current EOS time.
             # These times are used to calculate the number of days until the certificate expires.
-            if not (certificate_data := get_value(certificate_output, f"certificates..{certificate.certificate_name}", separator="..")):
+            if not (certificate_data := certificates_output.get(certificate.certificate_name)):
                 self.result.is_failure(f"SSL certificate '{certificate.certificate_name}', is not configured.\n")
                 continue
 
             expiry_time = certificate_data["notAfter"]
-            day_difference = (datetime.fromtimestamp(expiry_time, tz=timezone.utc) - datetime.fromtimestamp(current_timestamp, tz=timezone.utc)).days
+            # Whole days left, floored like timedelta.days
+            day_difference = int((expiry_time - current_timestamp) // 86400)
 
             # Verify certificate expiry
             if 0 < day_difference < certificate.expiry_threshold:
@@ -462,18 +469,16 @@ class VerifyAPISSLCertificate(AntaTest):
                 self.result.is_failure(f"SSL certificate `{certificate.certificate_name}` is expired.\n")
 
             # Verify certificate common subject name, encryption algorithm and key size
-            keys_to_verify = ["subject.commonName", "publicKey.encryptionAlgorithm", "publicKey.size"]
-            actual_certificate_details = {key: get_value(certificate_data, key) for key in keys_to_verify}
-
-            expected_certificate_details = {
-                "subject.commonName": certificate.common_name,
-                "publicKey.encryptionAlgorithm": certificate.encryption_algorithm,
-                "publicKey.size": certificate.key_size,
-            }
+            subject = certificate_data.get("subject", {})
+            public_key = certificate_data.get("publicKey", {})
+            actual_certificate_details = (subject.get("commonName"), public_key.get("encryptionAlgorithm"), public_key.get("size"))
+            expected_certificate_details = (certificate.common_name, certificate.encryption_algorithm, certificate.key_size)
 
             if actual_certificate_details != expected_certificate_details:
                 failed_log = f"SSL certificate `{certificate.certificate_name}` is not configured properly:"
-                failed_log += get_failed_logs(expected_certificate_details, actual_certificate_details)
+                failed_log += get_failed_logs(
+                    dict(zip(CERTIFICATE_DETAILS_KEYS, expected_certificate_details)), dict(zip(CERTIFICATE_DETAILS_KEYS, actual_certificate_details))
+                )
                 self.result.is_failure(f"{failed_log}\n")
 
 
@@ -505,16 +510,16 @@ class VerifyBannerLogin(AntaTest):
     class Input(AntaTest.Input):
         """Input model for the VerifyBannerLogin test."""
 
-        login_banner: str
-        """Expected login banner of the device."""
+        login_banner: Banner
+        """Expected login banner of the device. Leading and trailing whitespaces are removed from each line."""
 
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyBannerLogin."""
         login_banner = self.instance_commands[0].json_output["loginBanner"]
 
-        # Remove leading and trailing whitespaces from each line
-        cleaned_banner = "\n".join(line.strip() for line in self.inputs.login_banner.split("\n"))
+        # Leading and trailing whitespaces are removed from each line when the inputs are validated
+        cleaned_banner = self.inputs.login_banner
         if login_banner != cleaned_banner:
             self.result.is_failure(f"Expected `{cleaned_banner}` as the login banner, but found `{login_banner}` instead.")
         else:
@@ -549,16 +554,16 @@ class VerifyBannerMotd(AntaTest):
     class Input(AntaTest.Input):
         """Input model for the VerifyBannerMotd test."""
 
-        motd_banner: str
-        """Expected motd banner of the device."""
+        motd_banner: Banner
+        """Expected motd banner of the device. Leading and trailing whitespaces are removed from each line."""
 
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyBannerMotd."""
         motd_banner = self.instance_commands[0].json_output["motd"]
 
-        # Remove leading and trailing whitespaces from each line
-        cleaned_banner = "\n".join(line.strip() for line in self.inputs.motd_banner.split("\n"))
+        # Leading and trailing whitespaces are removed from each line when the inputs are validated
+        cleaned_banner = self.inputs.motd_banner
         if motd_banner != cleaned_banner:
             self.result.is_failure(f"Expected `{cleaned_banner}` as the motd banner, but found `{motd_banner}` instead.")
         else:
@@ -644,20 +649,23 @@ class VerifyIPv4ACL(AntaTest):
                 self.result.is_failure(f"{acl_name}: Not found")
                 continue
 
+            # Index the configured entries by sequence number for constant time lookups
+            actual_entries = {entry["sequenceNumber"]: entry for entry in ipv4_acl_list[0]["sequence"]}
+
             # Check if the sequence number is configured and has the correct action applied
-            failed_log = f"{acl_name}:\n"
+            failed_logs = []
             for acl_entry in acl_entries:
                 acl_seq = acl_entry.sequence
                 acl_action = acl_entry.action
-                if (actual_entry := get_item(ipv4_acl_list[0]["sequence"], "sequenceNumber", acl_seq)) is None:
-                    failed_log += f"Sequence number `{acl_seq}` is not found.\n"
+                if (actual_entry := actual_entries.get(acl_seq)) is None:
+                    failed_logs.append(f"Sequence number `{acl_seq}` is not found.\n")
                     continue
 
                 if actual_entry["text"] != acl_action:
-                    failed_log += f"Expected `{acl_action}` as sequence number {acl_seq} action but found `{actual_entry['text']}` instead.\n"
+                    failed_logs.append(f"Expected `{acl_action}` as sequence number {acl_seq} action but found `{actual_entry['text']}` instead.\n")
 
-            if failed_log != f"{acl_name}:\n":
-                self.result.is_failure(f"{failed_log}")
+            if failed_logs:
+                self.result.is_failure(f"{acl_name}:\n{''.join(failed_logs)}")
 
 
 class VerifyIPSecConnHealth(AntaTest):
@@ -686,7 +694,6 @@ class VerifyIPSecConnHealth(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyIPSecConnHealth."""
         self.result.is_success()
-        failure_conn = []
         command_output = self.instance_commands[0].json_output["connections"]
 
         # Check if IP security connection is configured
@@ -694,14 +701,12 @@ class VerifyIPSecConnHealth(AntaTest):
             self.result.is_failure("No IPv4 security connection configured.")
             return
 
-        # Iterate over all ipsec connections
-        for conn_data in command_output.values():
-            state = next(iter(conn_data["pathDict"].values()))
-            if state != "Established":
-                source = conn_data.get("saddr")
-                destination = conn_data.get("daddr")
-                vrf = conn_data.get("tunnelNs")
-                failure_conn.append(f"source:{source} destination:{destination} vrf:{vrf}")
+        # Collect all ipsec connections which are not established
+        failure_conn = [
+            f"source:{conn_data.get('saddr')} destination:{conn_data.get('daddr')} vrf:{conn_data.get('tunnelNs')}"
+            for conn_data in command_output.values()
+            if next(iter(conn_data["pathDict"].values())) != "Established"
+        ]
         if failure_conn:
             failure_msg = "\n".join(failure_conn)
             self.result.is_failure(f"The following IPv4 security connections are not established:\n{failure_msg}.")
@@ -809,14 +814,12 @@ class VerifySpecificIPSecConn(AntaTest):
                 source_input = str(connection.source_address)
                 destination_input = str(connection.destination_address)
 
-                if (source_input, destination_input, vrf) in existing_connections:
-                    existing_state = existing_connections[(source_input, destination_input, vrf)]
-                    if existing_state != "Established":
-                        self.result.is_failure(
-                            f"Expected state of IPv4 security connection `source:{source_input} destination:{destination_input} vrf:{vrf}` "
-                            f"for peer `{peer}` is `Established` but found `{existing_state}` instead."
-                        )
-                else:
+                if (existing_state := existing_connections.get((source_input, destination_input, vrf))) is None:
                     self.result.is_failure(
                         f"IPv4 security connection `source:{source_input} destination:{destination_input} vrf:{vrf}` for peer `{peer}` is not found."
                     )
+                elif existing_state != "Established":
+                    self.result.is_failure(
+                        f"Expected state of IPv4 security connection `source:{source_input} destination:{destination_input} vrf:{vrf}` "
+                        f"for peer `{peer}` is `Established` but found `{existing_state}` instead."
+                    )
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 from anta.custom_types import PositiveInteger
 from anta.models import AntaCommand, AntaTest
+from anta.tools import get_inactive_acls
 
 if TYPE_CHECKING:
     from anta.models import AntaTemplate
@@ -95,7 +96,7 @@ class VerifySnmpIPv4Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} SNMP IPv4 ACL(s) in vrf {self.inputs.vrf} but got {ipv4_acl_number}")
             return
 
-        not_configured_acl = [acl["name"] for acl in ipv4_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        not_configured_acl = get_inactive_acls(ipv4_acl_list, self.inputs.vrf)
 
         if not_configured_acl:
             self.result.is_failure(f"SNMP IPv4 ACL(s) not configured or active in vrf {self.inputs.vrf}: {not_configured_acl}")
@@ -144,7 +145,7 @@ class VerifySnmpIPv6Acl(AntaTest):
             self.result.is_failure(f"Expected {self.inputs.number} SNMP IPv6 ACL(s) in vrf {self.inputs.vrf} but got {ipv6_acl_number}")
             return
 
-        acl_not_configured = [acl["name"] for acl in ipv6_acl_list if self.inputs.vrf not in acl["configuredVrfs"] or self.inputs.vrf not in acl["activeVrfs"]]
+        acl_not_configured = get_inactive_acls(ipv6_acl_list, self.inputs.vrf)
 
         if acl_not_configured:
             self.result.is_failure(f"SNMP IPv6 ACL(s) not configured or active in vrf {self.inputs.vrf}: {acl_not_configured}")
@@ -58,6 +58,22 @@ def get_failed_logs(expected_output: dict[Any, Any], actual_output: dict[Any, An
     return "".join(failed_logs)
 
 
+def get_inactive_acls(acl_list: list[dict[str, Any]], vrf: str) -> list[str]:
+    """Get the names of the ACLs that are not configured or not active in a VRF.
+
+    Args:
+    ----
+    acl_list (list): ACL summaries as returned under `aclList` by the EOS `access-list summary` commands.
+    vrf (str): Name of the VRF in which the ACLs should be configured and active.
+
+    Returns
+    -------
+    list[str]: Names of the ACLs not configured or not active in the VRF.
+
+    """
+    return [acl["name"] for acl in acl_list if vrf not in acl["configuredVrfs"] or vrf not in acl["activeVrfs"]]
+
+
 def custom_division(numerator: float, denominator: float) -> int | float:
     """Get the custom division of numbers.
 
@@ -72,6 +88,11 @@ def custom_division(numerator: float, denominator: float) -> int | float:
     -------
     Union[int, float]: The result of the division.
     """
+    # Integer fast path, exact even for integers too large to be represented as floats
+    if isinstance(numerator, int) and isinstance(denominator, int):
+        quotient, remainder = divmod(numerator, denominator)
+        if not remainder:
+            return quotient
     result = numerator / denominator
     return int(result) if result.is_integer() else result
 
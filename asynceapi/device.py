@@ -9,6 +9,9 @@
 
 from __future__ import annotations
 
+import json
+import re
+from contextlib import suppress
 from socket import getservbyname
 from typing import TYPE_CHECKING, Any
 
@@ -17,6 +20,11 @@ from typing import TYPE_CHECKING, Any
 # -----------------------------------------------------------------------------
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # -----------------------------------------------------------------------------
 # Private Imports
 # -----------------------------------------------------------------------------
@@ -35,6 +43,26 @@ if TYPE_CHECKING:
 __all__ = ["Device"]
 
 
+# orjson decodes integers outside [-2**63, 2**64 - 1] as floats without raising.
+# Any such integer has at least 19 digits, bodies containing one are decoded with the standard library.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+def json_loads(content: bytes) -> Any:  # noqa: ANN401
+    """
+    Decode a JSON-RPC response body.
+
+    orjson is used when installed. The standard library `json` module is used
+    instead when the body may contain integers that orjson cannot represent,
+    and when orjson rejects the body (NaN, Infinity or out-of-range floats),
+    so that the result does not depend on whether orjson is installed.
+    """
+    if orjson is not None and _LONG_DIGITS.search(content) is None:
+        with suppress(orjson.JSONDecodeError):
+            return orjson.loads(content)
+    return json.loads(content)
+
+
 # -----------------------------------------------------------------------------
 #
 #                                 CODE BEGINS
@@ -239,7 +267,7 @@ class Device(httpx.AsyncClient):
         """
         res = await self.post("/command-api", json=jsonrpc)
         res.raise_for_status()
-        body = res.json()
+        body = json_loads(res.content)
 
         commands = jsonrpc["params"]["cmds"]
         ofmt = jsonrpc["params"]["format"]
@@ -131,7 +131,7 @@ ANTA_INVENTORY_TESTS_VALID = [
         "parameters": {
             "ipaddress_in_scope": "192.168.0.17",
             "ipaddress_out_of_scope": "192.168.1.1",
-            "nb_hosts": 2,
+            "nb_hosts": 3,
         },
     },
     {
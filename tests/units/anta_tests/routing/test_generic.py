@@ -66,6 +66,23 @@ DATA: list[dict[str, Any]] = [
         "inputs": {"minimum": 42, "maximum": 666},
         "expected": {"result": "failure", "messages": ["routing-table has 1000 routes and not between min (42) and maximum (666)"]},
     },
+    {
+        "name": "success-zero-minimum",
+        "test": VerifyRoutingTableSize,
+        "eos_data": [
+            {
+                "vrfs": {
+                    "default": {
+                        # Output truncated
+                        "maskLen": {},
+                        "totalRoutes": 0,
+                    },
+                },
+            },
+        ],
+        "inputs": {"minimum": 0, "maximum": 666},
+        "expected": {"result": "success"},
+    },
     {
         "name": "error-max-smaller-than-min",
         "test": VerifyRoutingTableSize,
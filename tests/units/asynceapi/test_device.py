@@ -0,0 +1,61 @@
+# Copyright (c) 2024 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Tests for asynceapi.device.py."""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from asynceapi import Device
+
+JSONRPC_REQUEST: dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "method": "runCmds",
+    "params": {"version": "latest", "cmds": [{"cmd": "show interfaces counters"}], "format": "json"},
+    "id": "EapiExplorer-1",
+}
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("use_orjson", [pytest.param(True, id="orjson"), pytest.param(False, id="json")])
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param(b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"inOctets": 1234}]}', [{"inOctets": 1234}], id="valid"),
+        pytest.param(
+            b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"inOctets": 18446744073709551615}]}',
+            [{"inOctets": 18446744073709551615}],
+            id="uint64",
+        ),
+        pytest.param(
+            b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"inOctets": 18446744073709551616}]}',
+            [{"inOctets": 18446744073709551616}],
+            id="above uint64",
+        ),
+        pytest.param(
+            b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"offset": -9223372036854775809}]}',
+            [{"offset": -9223372036854775809}],
+            id="below int64",
+        ),
+        pytest.param(b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"rate": NaN}]}', [{"rate": float("nan")}], id="NaN"),
+        pytest.param(b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"rate": Infinity}]}', [{"rate": float("inf")}], id="Infinity"),
+        pytest.param(b'{"jsonrpc": "2.0", "id": "EapiExplorer-1", "result": [{"rate": 1e400}]}', [{"rate": float("inf")}], id="out-of-range float"),
+    ],
+)
+async def test_jsonrpc_exec_decoding(use_orjson: bool, content: bytes, expected: list[dict[str, Any]]) -> None:
+    """Test Device.jsonrpc_exec decodes the response body identically with orjson and with the standard library json module."""
+    orjson_patch: AbstractContextManager[Any] = nullcontext() if use_orjson else patch("asynceapi.device.orjson", None)
+    if use_orjson:
+        pytest.importorskip("orjson")
+    device = Device(host="42.42.42.42", username="anta", password="anta")
+    response = httpx.Response(200, content=content, request=httpx.Request("POST", "https://42.42.42.42/command-api"))
+    with orjson_patch, patch.object(device, "post", return_value=response):
+        result = await device.jsonrpc_exec(JSONRPC_REQUEST)
+    # NaN is not equal to itself, compare the representations, which also tells int from float
+    assert repr(result) == repr(expected)
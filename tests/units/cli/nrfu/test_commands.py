@@ -9,6 +9,9 @@ import json
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import PropertyMock, patch
+
+from rich.console import Console
 
 from anta.cli import anta
 from anta.cli.utils import ExitCode
@@ -89,6 +92,20 @@ def test_anta_nrfu_json(click_runner: CliRunner) -> None:
             assert res["result"] == "success"
 
 
+def test_anta_nrfu_json_terminal(click_runner: CliRunner) -> None:
+    """Test anta nrfu json when the output is a terminal."""
+    with patch.object(Console, "is_terminal", new_callable=PropertyMock, return_value=True), patch("rich.print_json") as print_json_mock:
+        result = click_runner.invoke(anta, ["nrfu", "json"])
+    assert result.exit_code == ExitCode.OK
+    assert "JSON results" in result.output
+    print_json_mock.assert_called_once()
+    result_list = json.loads(print_json_mock.call_args.args[0])
+    for res in result_list:
+        if res["name"] == "dummy":
+            assert res["test"] == "VerifyEOSVersion"
+            assert res["result"] == "success"
+
+
 def test_anta_nrfu_template(click_runner: CliRunner) -> None:
     """Test anta nrfu, catalog is given via env."""
     result = click_runner.invoke(anta, ["nrfu", "tpl-report", "--template", str(DATA_DIR / "template.j2")])
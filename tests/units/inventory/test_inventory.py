@@ -55,9 +55,10 @@ class TestAntaInventory:
         """
         inventory_file = self.create_inventory(content=test_definition["input"], tmp_path=tmp_path)
         try:
-            AntaInventory.parse(filename=inventory_file, username="arista", password="arista123")
+            inventory = AntaInventory.parse(filename=inventory_file, username="arista", password="arista123")
         except ValidationError as exc:
             raise AssertionError from exc
+        assert len(inventory) == test_definition["parameters"]["nb_hosts"]
 
     @pytest.mark.parametrize("test_definition", ANTA_INVENTORY_TESTS_INVALID, ids=generate_test_ids_dict)
     def test_init_invalid(self, test_definition: dict[str, Any], tmp_path: Path) -> None:
@@ -197,3 +197,14 @@ class TestReportJinja:
         """Test __init__ failure if file is not found."""
         with pytest.raises(FileNotFoundError, match="template file is not found: /gnu/terry/pratchett"):
             ReportJinja(Path("/gnu/terry/pratchett"))
+
+    def test_render_template_cache(self, tmp_path: Path) -> None:
+        """Test that the template is compiled once per set of rendering options."""
+        template_path = tmp_path / "template.j2"
+        template_path.write_text("{% for d in data %}{{ d.name }}{% endfor %}", encoding="utf-8")
+        reporter = ReportJinja(template_path)
+        assert reporter.render([{"name": "leaf1"}]) == "leaf1"
+        # Changing the file on disk does not trigger a new compilation
+        template_path.write_text("changed", encoding="utf-8")
+        assert reporter.render([{"name": "leaf1"}]) == "leaf1"
+        assert reporter.render([{"name": "leaf1"}], trim_blocks=False) == "changed"
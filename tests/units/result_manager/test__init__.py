@@ -71,6 +71,15 @@ class TestResultManager:
             assert test.get("custom_field") is None
             assert test.get("result") == "success"
 
+    def test_dump(self, list_result_factory: Callable[[int], list[TestResult]]) -> None:
+        """Test ResultManager.dump property."""
+        result_manager = ResultManager()
+        result_manager.results = list_result_factory(3)
+
+        dump = result_manager.dump
+        assert isinstance(dump, list)
+        assert dump == json.loads(result_manager.json)
+
     @pytest.mark.parametrize(
         ("starting_status", "test_status", "expected_status", "expected_raise"),
         [
@@ -29,6 +29,7 @@ from anta.custom_types import (
     bgp_multiprotocol_capabilities_abbreviations,
     interface_autocomplete,
     interface_case_sensitivity,
+    strip_lines,
 )
 
 # ------------------------------------------------------------------------------
@@ -262,3 +263,9 @@ def test_interface_case_sensitivity_uppercase() -> None:
     assert interface_case_sensitivity("ETHERNET") == "ETHERNET"
     assert interface_case_sensitivity("VLAN") == "VLAN"
     assert interface_case_sensitivity("LOOPBACK") == "LOOPBACK"
+
+
+def test_strip_lines() -> None:
+    """Test strip_lines."""
+    assert strip_lines("  line 1  \n\tline 2\n") == "line 1\nline 2\n"
+    assert strip_lines("single line ") == "single line"
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
@@ -654,6 +655,42 @@ class TestAntaDevice:
             assert device.cache is None
             device._collect.assert_called_once_with(command=command, collection_id=None)  # type: ignore[attr-defined]  # pylint: disable=protected-access
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("device", [{"disable_cache": True}], indirect=True)
+    async def test_collect_commands_exception(self, device: AntaDevice) -> None:
+        """Test that AntaDevice.collect_commands() records an unexpected exception on the failing command only."""
+
+        def _collect(command: AntaCommand, *args: Any, **kwargs: Any) -> None:  # noqa: ARG001, ANN401 #pylint: disable=unused-argument
+            if command.command == "show bad":
+                msg = "Oops"
+                raise RuntimeError(msg)
+            command.output = COMMAND_OUTPUT
+
+        commands = [AntaCommand(command="show good"), AntaCommand(command="show bad")]
+        with patch.object(device, "_collect", side_effect=_collect):
+            await device.collect_commands(commands)
+        assert commands[0].collected
+        assert not commands[0].errors
+        assert not commands[1].collected
+        assert commands[1].errors == ["RuntimeError: Oops"]
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("device", [{"disable_cache": True}], indirect=True)
+    async def test_collect_commands_base_exception(self, device: AntaDevice) -> None:
+        """Test that AntaDevice.collect_commands() re-raises a BaseException that is not an Exception once all commands have been collected."""
+
+        def _collect(command: AntaCommand, *args: Any, **kwargs: Any) -> None:  # noqa: ARG001, ANN401 #pylint: disable=unused-argument
+            if command.command == "show cancelled":
+                raise asyncio.CancelledError
+            command.output = COMMAND_OUTPUT
+
+        commands = [AntaCommand(command="show cancelled"), AntaCommand(command="show good")]
+        with patch.object(device, "_collect", side_effect=_collect), pytest.raises(asyncio.CancelledError):
+            await device.collect_commands(commands)
+        assert not commands[0].collected
+        assert not commands[0].errors
+        assert commands[1].collected
+
     @pytest.mark.parametrize(("device", "expected"), CACHE_STATS_DATA, indirect=["device"])
     def test_cache_statistics(self, device: AntaDevice, expected: dict[str, Any] | None) -> None:
         """Verify that when cache statistics attribute does not exist.
@@ -683,6 +720,28 @@ class TestAsyncEOSDevice:
         with patch("anta.device.__DEBUG__", new=True):
             rprint(device)
 
+    @pytest.mark.parametrize("max_concurrency", [pytest.param(0, id="zero"), pytest.param(-1, id="negative")])
+    def test__init__invalid_max_concurrency(self, max_concurrency: int) -> None:
+        """Test the AsyncEOSDevice constructor rejects a max_concurrency lower than 1."""
+        with pytest.raises(ValueError, match="'max_concurrency' must be at least 1 to instantiate device '42.42.42.42'"):
+            AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta", max_concurrency=max_concurrency)
+
+    @pytest.mark.parametrize(
+        ("max_concurrency", "expected_limits"),
+        [
+            pytest.param(None, httpx.Limits(max_connections=100, max_keepalive_connections=20), id="default"),
+            pytest.param(10, httpx.Limits(max_connections=10, max_keepalive_connections=20), id="max_concurrency"),
+        ],
+    )
+    def test__init__limits(self, max_concurrency: int | None, expected_limits: httpx.Limits) -> None:
+        """Test the HTTP connection pool limits passed by the AsyncEOSDevice constructor to asynceapi.Device."""
+        kwargs: dict[str, Any] = {"host": "42.42.42.42", "username": "anta", "password": "anta"}
+        if max_concurrency is not None:
+            kwargs["max_concurrency"] = max_concurrency
+        with patch("anta.device.asynceapi.Device") as device_mock:
+            AsyncEOSDevice(**kwargs)
+        assert device_mock.call_args.kwargs["limits"] == expected_limits
+
     @pytest.mark.parametrize("data", EQUALITY_DATA, ids=generate_test_ids_list(EQUALITY_DATA))
     def test__eq(self, data: dict[str, Any]) -> None:
         """Test the AsyncEOSDevice equality."""
@@ -712,6 +771,44 @@ class TestAsyncEOSDevice:
             assert async_device.established == expected["established"]
             assert async_device.hw_model == expected["hw_model"]
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("check_connection_result", "expected_raise"),
+        [
+            pytest.param(False, nullcontext(), id="offline"),
+            pytest.param(ConnectionRefusedError(), pytest.raises(ConnectionRefusedError), id="connection refused"),
+        ],
+    )
+    async def test_refresh_cancel_show_version(
+        self, async_device: AsyncEOSDevice, check_connection_result: bool | Exception, expected_raise: AbstractContextManager[Exception]
+    ) -> None:
+        # pylint: disable=protected-access
+        """Test AsyncEOSDevice.refresh() cancels the pending 'show version' request when the eAPI port check does not succeed."""
+        cancelled = asyncio.Event()
+
+        async def cli(*_args: object, **_kwargs: object) -> None:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def check_connection() -> bool:
+            # Let the 'show version' request start before the port check completes
+            await asyncio.sleep(0)
+            if isinstance(check_connection_result, Exception):
+                raise check_connection_result
+            return check_connection_result
+
+        with patch.object(async_device._session, "check_connection", side_effect=check_connection), patch.object(async_device._session, "cli", side_effect=cli):
+            with expected_raise:
+                await async_device.refresh()
+            assert cancelled.is_set()
+            assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+            assert async_device.is_online is False
+            assert async_device.established is False
+            assert async_device.hw_model is None
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
         ("async_device", "command", "expected"),
@@ -745,6 +842,28 @@ class TestAsyncEOSDevice:
             assert cmd.output == expected["output"]
             assert cmd.errors == expected["errors"]
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("async_device", [{"max_concurrency": 2, "disable_cache": True}], indirect=True)
+    async def test__collect_max_concurrency(self, async_device: AsyncEOSDevice) -> None:
+        # pylint: disable=protected-access
+        """Test that AsyncEOSDevice._collect() does not exceed max_concurrency in-flight eAPI requests."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def cli(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: ARG001, ANN401 #pylint: disable=unused-argument
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [{}]
+
+        commands = [AntaCommand(command=f"show version {i}") for i in range(10)]
+        with patch.object(async_device._session, "cli", side_effect=cli):
+            await async_device.collect_commands(commands)
+        assert max_in_flight == 2
+        assert all(command.collected for command in commands)
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
         ("async_device", "copy"),
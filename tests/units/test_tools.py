@@ -11,7 +11,7 @@ from typing import Any
 
 import pytest
 
-from anta.tools import custom_division, get_dict_superset, get_failed_logs, get_item, get_value
+from anta.tools import custom_division, get_dict_superset, get_failed_logs, get_inactive_acls, get_item, get_value
 
 TEST_GET_FAILED_LOGS_DATA = [
     {"id": 1, "name": "Alice", "age": 30, "email": "alice@example.com"},
@@ -497,8 +497,31 @@ def test_get_item(
         pytest.param(4, 2, 2, id="int return for int input"),
         pytest.param(5.0, 2.0, 2.5, id="float return for float input"),
         pytest.param(5, 2, 2.5, id="float return for int input"),
+        pytest.param(10**18 + 2, 2, 5 * 10**17 + 1, id="exact int return for large int input"),
     ],
 )
 def test_custom_division(numerator: float, denominator: float, expected_result: str) -> None:
     """Test custom_division."""
     assert custom_division(numerator, denominator) == expected_result
+
+
+@pytest.mark.parametrize(
+    ("acl_list", "vrf", "expected_result"),
+    [
+        pytest.param([], "default", [], id="no ACL"),
+        pytest.param([{"name": "ACL1", "configuredVrfs": ["default"], "activeVrfs": ["default"]}], "default", [], id="configured and active"),
+        pytest.param([{"name": "ACL1", "configuredVrfs": ["MGMT"], "activeVrfs": ["MGMT"]}], "default", ["ACL1"], id="other VRF"),
+        pytest.param(
+            [
+                {"name": "ACL1", "configuredVrfs": ["default"], "activeVrfs": []},
+                {"name": "ACL2", "configuredVrfs": ["default", "MGMT"], "activeVrfs": ["MGMT", "default"]},
+            ],
+            "default",
+            ["ACL1"],
+            id="configured but not active",
+        ),
+    ],
+)
+def test_get_inactive_acls(acl_list: list[dict[str, Any]], vrf: str, expected_result: list[str]) -> None:
+    """Test get_inactive_acls."""
+    assert get_inactive_acls(acl_list, vrf) == expected_result